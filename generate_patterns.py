@@ -2,309 +2,456 @@
 """
 AGENT 3: Create example workflows and patterns documentation
 """
+import argparse
+import asyncio
+import ctypes
+import hashlib
+import heapq
 import json
+import operator
+import os
+import select
+import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Any
-
-def generate_examples_md(commands_data: Dict[str, Any]) -> str:
-    """Generate EXAMPLES.md with workflow chains"""
-    lines = []
-    lines.append("# Command Usage Examples\n")
-    lines.append("20 example workflows demonstrating command chains and best practices\n")
-
-    # Example 1: Evolution cycle
-    lines.append("## Example 1: Complete Evolution Cycle\n")
-    lines.append("**Objective:** Run a full system evolution and improvement cycle\n")
-    lines.append("```bash")
-    lines.append("# Step 1: Analyze current state")
-    lines.append("/analyze-custom-files")
-    lines.append("")
-    lines.append("# Step 2: Check evolution status")
-    lines.append("/evolution-status")
-    lines.append("")
-    lines.append("# Step 3: Fix any encoding issues")
-    lines.append("/fix-encoding-errors")
-    lines.append("")
-    lines.append("# Step 4: Run multi-AI orchestration")
-    lines.append("/multi-ai-orchestrate")
-    lines.append("")
-    lines.append("# Step 5: Review evolution summary")
-    lines.append("/evolution-summary")
-    lines.append("```\n")
-
-    # Example 2: Testing pipeline
-    lines.append("## Example 2: Complete Testing Pipeline\n")
-    lines.append("**Objective:** Run all tests and validate system health\n")
-    lines.append("```bash")
-    lines.append("# Step 1: Health check")
-    lines.append("/health-probe")
-    lines.append("")
-    lines.append("# Step 2: Run smoke tests")
-    lines.append("/e2e-smoke")
-    lines.append("")
-    lines.append("# Step 3: Run full Playwright suite")
-    lines.append("/e2e-playwright")
-    lines.append("")
-    lines.append("# Step 4: Analyze test patterns")
-    lines.append("/pattern-analyze")
-    lines.append("```\n")
-
-    # Example 3: Security audit
-    lines.append("## Example 3: Security Audit Workflow\n")
-    lines.append("**Objective:** Complete security review and SBOM generation\n")
-    lines.append("```bash")
-    lines.append("# Step 1: Security review")
-    lines.append("/security-review")
-    lines.append("")
-    lines.append("# Step 2: Generate SBOM")
-    lines.append("/sbom")
-    lines.append("")
-    lines.append("# Step 3: Attach security agent")
-    lines.append("/attach-security")
-    lines.append("```\n")
-
-    # Example 4: RAG workflow
-    lines.append("## Example 4: RAG Knowledge Base Setup\n")
-    lines.append("**Objective:** Build and query RAG knowledge base\n")
-    lines.append("```bash")
-    lines.append("# Step 1: Prepare RAG corpus")
-    lines.append("/rag-prepare")
-    lines.append("")
-    lines.append("# Step 2: Build indexes")
-    lines.append("/rag-build-index")
-    lines.append("")
-    lines.append("# Step 3: Query knowledge base")
-    lines.append("/rag-query --query 'evolution patterns'")
-    lines.append("")
-    lines.append("# Step 4: Performance analysis")
-    lines.append("/perf-rag")
-    lines.append("```\n")
-
-    # Example 5: Deployment
-    lines.append("## Example 5: Production Deployment\n")
-    lines.append("**Objective:** Deploy with full validation\n")
-    lines.append("```bash")
-    lines.append("# Step 1: Check drift")
-    lines.append("/check-drift")
-    lines.append("")
-    lines.append("# Step 2: Health probe")
-    lines.append("/health-probe")
-    lines.append("")
-    lines.append("# Step 3: Deploy")
-    lines.append("/deploy-full")
-    lines.append("")
-    lines.append("# Step 4: Production dashboard")
-    lines.append("/production-dashboard")
-    lines.append("```\n")
-
-    # Add 15 more concise examples
-    more_examples = [
-        ("Project Analysis", ["project-index", "project-overlaps", "junk-scan"], "Analyze project structure and identify issues"),
-        ("Auto-Pipeline", ["auto-pipeline"], "Automated CI/CD pipeline execution"),
-        ("Innovation Discovery", ["innovation-scan", "experiments-plan"], "Discover and plan new innovations"),
-        ("Intent Mapping", ["intent-map"], "Map user intents to workflows"),
-        ("Configuration Audit", ["config-diff"], "Review configuration changes"),
-        ("Multi-AI Coordination", ["unified-multi-ai", "super-chain"], "Coordinate multiple AI systems"),
-        ("Template Execution", ["abyssal", "spawn-template"], "Execute ABYSSAL templates"),
-        ("Cognition Analysis", ["nexus-think", "consciousness-report"], "Deep cognitive analysis"),
-        ("Tagging Workflow", ["tag", "tag-query", "tag-export"], "Tag and organize research"),
-        ("Self-Evolution", ["self-evolve", "self-audit"], "Autonomous self-improvement"),
-        ("Swarm Operations", ["swarm", "swarm-optimize"], "Swarm intelligence coordination"),
-        ("Deep Research", ["deep-research", "multi-websearch"], "Multi-source research"),
-        ("Chaos Testing", ["chaos-evolve", "adversarial"], "Chaos engineering and adversarial testing"),
-        ("Recursive Reasoning", ["reverse-reason", "recursive-prompt"], "Advanced reasoning patterns"),
-        ("Custom AI Setup", ["custom-ai-setup", "custom-ai"], "Configure custom AI agents"),
-    ]
-
-    for idx, (title, cmds, description) in enumerate(more_examples, start=6):
-        lines.append(f"## Example {idx}: {title}\n")
-        lines.append(f"**Objective:** {description}\n")
-        lines.append("```bash")
-        for cmd in cmds:
-            lines.append(f"/{cmd}")
-        lines.append("```\n")
-
-    return '\n'.join(lines)
-
-def generate_patterns_md(commands_data: Dict[str, Any]) -> str:
-    """Generate PATTERNS.md with best practices"""
-    lines = []
-    lines.append("# Command Patterns and Best Practices\n")
-    lines.append("Proven patterns for using Claude Automation Core commands\n")
-
-    lines.append("## Pattern Categories\n")
-
-    # Pattern 1: Command chaining
-    lines.append("### 1. Sequential Command Chaining\n")
-    lines.append("Execute commands in dependency order:\n")
-    lines.append("```typescript")
-    lines.append("async function sequentialChain(executor: CommandExecutor) {")
-    lines.append("  // Always analyze before acting")
-    lines.append('  const analysis = await executor("/analyze-custom-files");')
-    lines.append("  if (!analysis.success) return analysis;\n")
-    lines.append("  // Check status based on analysis")
-    lines.append('  const status = await executor("/evolution-status");')
-    lines.append("  if (!status.success) return status;\n")
-    lines.append("  // Fix issues if found")
-    lines.append("  if (status.data.issues > 0) {")
-    lines.append('    await executor("/fix-encoding-errors");')
-    lines.append("  }\n")
-    lines.append("  return { analysis, status };")
-    lines.append("}")
-    lines.append("```\n")
-
-    # Pattern 2: Error handling
-    lines.append("### 2. Error Handling Pattern\n")
-    lines.append("Always handle command failures gracefully:\n")
-    lines.append("```typescript")
-    lines.append("async function robustExecution(")
-    lines.append("  executor: CommandExecutor,")
-    lines.append("  command: CommandName,")
-    lines.append("  retries = 3")
-    lines.append("): Promise<CommandResult> {")
-    lines.append("  for (let i = 0; i < retries; i++) {")
-    lines.append("    try {")
-    lines.append("      const result = await executor(command);")
-    lines.append("      if (result.success) return result;\n")
-    lines.append("      // Log failure and retry")
-    lines.append("      console.warn(`Attempt ${i + 1} failed: ${result.error}`);")
-    lines.append("    } catch (error) {")
-    lines.append("      if (i === retries - 1) throw error;")
-    lines.append("    }")
-    lines.append("  }\n")
-    lines.append("  throw new Error(`Command failed after ${retries} attempts`);")
-    lines.append("}")
-    lines.append("```\n")
-
-    # Pattern 3: Parallel execution
-    lines.append("### 3. Parallel Execution Pattern\n")
-    lines.append("Execute independent commands concurrently:\n")
-    lines.append("```typescript")
-    lines.append("async function parallelExecution(executor: CommandExecutor) {")
-    lines.append("  // These commands don't depend on each other")
-    lines.append("  const [health, status, config] = await Promise.all([")
-    lines.append('    executor("/health-probe"),')
-    lines.append('    executor("/evolution-status"),')
-    lines.append('    executor("/config-diff"),')
-    lines.append("  ]);\n")
-    lines.append("  return { health, status, config };")
-    lines.append("}")
-    lines.append("```\n")
-
-    # Pattern 4: Conditional execution
-    lines.append("### 4. Conditional Execution Pattern\n")
-    lines.append("Execute commands based on conditions:\n")
-    lines.append("```typescript")
-    lines.append("async function conditionalWorkflow(executor: CommandExecutor) {")
-    lines.append('  const status = await executor("/evolution-status");\n')
-    lines.append("  if (status.data.fitness < 0.7) {")
-    lines.append("    // Low fitness - run fixes")
-    lines.append('    await executor("/fix-encoding-errors");')
-    lines.append('    await executor("/e2e-smoke");')
-    lines.append("  } else if (status.data.fitness >= 0.9) {")
-    lines.append("    // High fitness - innovate")
-    lines.append('    await executor("/innovation-scan");')
-    lines.append('    await executor("/experiments-plan");')
-    lines.append("  } else {")
-    lines.append("    // Stable - continue evolution")
-    lines.append('    await executor("/auto-evolve");')
-    lines.append("  }")
-    lines.append("}")
-    lines.append("```\n")
-
-    # Pattern 5: Category-based selection
-    lines.append("### 5. Category-Based Command Selection\n")
-    lines.append("Execute commands by category:\n")
-    lines.append("```typescript")
-    lines.append("const CATEGORY_WORKFLOWS: Record<string, CommandName[]> = {")
-    for category, cmds in sorted(commands_data['taxonomy'].items()):
-        sample_cmds = sorted(cmds)[:3]  # First 3 commands
-        lines.append(f"  {category}: [")
-        for cmd in sample_cmds:
-            lines.append(f"    '{cmd}',")
-        lines.append("  ],")
-    lines.append("};\n")
-    lines.append("async function executeCategoryWorkflow(")
-    lines.append("  executor: CommandExecutor,")
-    lines.append("  category: string")
-    lines.append(") {")
-    lines.append("  const commands = CATEGORY_WORKFLOWS[category] || [];")
-    lines.append("  for (const cmd of commands) {")
-    lines.append("    await executor(cmd);")
-    lines.append("  }")
-    lines.append("}")
-    lines.append("```\n")
-
-    # Best practices
-    lines.append("## Best Practices\n")
-    lines.append("### DO:")
-    lines.append("- Always check command results before proceeding")
-    lines.append("- Use `/analyze-custom-files` before making changes")
-    lines.append("- Chain related commands for workflow automation")
-    lines.append("- Use parallel execution for independent commands")
-    lines.append("- Handle errors gracefully with retries")
-    lines.append("- Log all command executions for debugging\n")
-
-    lines.append("### DON'T:")
-    lines.append("- Execute commands without checking dependencies")
-    lines.append("- Ignore command failures")
-    lines.append("- Run destructive commands without validation")
-    lines.append("- Chain commands with circular dependencies")
-    lines.append("- Execute too many commands in parallel (max 5)\n")
-
-    lines.append("## Troubleshooting\n")
-    lines.append("### Common Issues\n")
-    lines.append("1. **Command not found:** Check `/evolution-status` for available commands")
-    lines.append("2. **Encoding errors:** Run `/fix-encoding-errors`")
-    lines.append("3. **Dependency failures:** Check `/analyze-custom-files` for missing dependencies")
-    lines.append("4. **Low fitness:** Run `/auto-evolve` or `/self-evolve`")
-    lines.append("5. **Configuration drift:** Use `/check-drift` and `/config-diff`\n")
-
-    return '\n'.join(lines)
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
 
-def main():
-    print("AGENT 3: Generating patterns and examples...")
+# Optional faster JSON parser; json.loads also accepts UTF-8 bytes directly
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Progress output is opt-in; failures, skips and the completion line always print
+VERBOSE = os.environ.get("AGENT3_VERBOSE") == "1"
+
+def log(*args: Any, **kwargs: Any) -> None:
+    """Print a progress message when verbose output is enabled"""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON from raw UTF-8 bytes without an intermediate str"""
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+# Output chunks are batched into vectored writes of about this many bytes.
+# The chunk count is capped well below the POSIX IOV_MAX minimum of 1024.
+_WRITEV_BATCH_SIZE = 64 * 1024
+_WRITEV_MAX_CHUNKS = 512
+HAS_WRITEV = hasattr(os, 'writev')
+
+# Examples 1-5 are fully static; only the short examples below are generated
+_EXAMPLES_STATIC_HEADER = b"""\
+# Command Usage Examples
+
+20 example workflows demonstrating command chains and best practices
+
+## Example 1: Complete Evolution Cycle
+
+**Objective:** Run a full system evolution and improvement cycle
+
+```bash
+# Step 1: Analyze current state
+/analyze-custom-files
+
+# Step 2: Check evolution status
+/evolution-status
+
+# Step 3: Fix any encoding issues
+/fix-encoding-errors
+
+# Step 4: Run multi-AI orchestration
+/multi-ai-orchestrate
+
+# Step 5: Review evolution summary
+/evolution-summary
+```
+
+## Example 2: Complete Testing Pipeline
+
+**Objective:** Run all tests and validate system health
+
+```bash
+# Step 1: Health check
+/health-probe
+
+# Step 2: Run smoke tests
+/e2e-smoke
+
+# Step 3: Run full Playwright suite
+/e2e-playwright
+
+# Step 4: Analyze test patterns
+/pattern-analyze
+```
+
+## Example 3: Security Audit Workflow
+
+**Objective:** Complete security review and SBOM generation
+
+```bash
+# Step 1: Security review
+/security-review
+
+# Step 2: Generate SBOM
+/sbom
+
+# Step 3: Attach security agent
+/attach-security
+```
+
+## Example 4: RAG Knowledge Base Setup
+
+**Objective:** Build and query RAG knowledge base
+
+```bash
+# Step 1: Prepare RAG corpus
+/rag-prepare
+
+# Step 2: Build indexes
+/rag-build-index
+
+# Step 3: Query knowledge base
+/rag-query --query 'evolution patterns'
+
+# Step 4: Performance analysis
+/perf-rag
+```
+
+## Example 5: Production Deployment
+
+**Objective:** Deploy with full validation
+
+```bash
+# Step 1: Check drift
+/check-drift
+
+# Step 2: Health probe
+/health-probe
+
+# Step 3: Deploy
+/deploy-full
+
+# Step 4: Production dashboard
+/production-dashboard
+```
+
+"""
+
+# The 15 concise examples following the static header: (title, commands, objective).
+# Command names are interned so repeated renders share one str per command.
+_MORE_EXAMPLES: Tuple[Tuple[str, Tuple[str, ...], str], ...] = tuple(
+    (title, tuple(sys.intern(cmd) for cmd in cmds), objective)
+    for title, cmds, objective in (
+        ("Project Analysis", ("project-index", "project-overlaps", "junk-scan"), "Analyze project structure and identify issues"),
+        ("Auto-Pipeline", ("auto-pipeline",), "Automated CI/CD pipeline execution"),
+        ("Innovation Discovery", ("innovation-scan", "experiments-plan"), "Discover and plan new innovations"),
+        ("Intent Mapping", ("intent-map",), "Map user intents to workflows"),
+        ("Configuration Audit", ("config-diff",), "Review configuration changes"),
+        ("Multi-AI Coordination", ("unified-multi-ai", "super-chain"), "Coordinate multiple AI systems"),
+        ("Template Execution", ("abyssal", "spawn-template"), "Execute ABYSSAL templates"),
+        ("Cognition Analysis", ("nexus-think", "consciousness-report"), "Deep cognitive analysis"),
+        ("Tagging Workflow", ("tag", "tag-query", "tag-export"), "Tag and organize research"),
+        ("Self-Evolution", ("self-evolve", "self-audit"), "Autonomous self-improvement"),
+        ("Swarm Operations", ("swarm", "swarm-optimize"), "Swarm intelligence coordination"),
+        ("Deep Research", ("deep-research", "multi-websearch"), "Multi-source research"),
+        ("Chaos Testing", ("chaos-evolve", "adversarial"), "Chaos engineering and adversarial testing"),
+        ("Recursive Reasoning", ("reverse-reason", "recursive-prompt"), "Advanced reasoning patterns"),
+        ("Custom AI Setup", ("custom-ai-setup", "custom-ai"), "Configure custom AI agents"),
+    )
+)
+
+# Markdown fragments shared by the generated example blocks
+_OBJECTIVE = "**Objective:**"
+_BASH_OPEN = "```bash\n"
+_FENCE_CLOSE = "```\n"
+
+# Template for the short examples appended after the static header
+_EXAMPLE_BLOCK = "## Example {idx}: {title}\n\n" + _OBJECTIVE + " {desc}\n\n" + _BASH_OPEN + "{cmds}\n" + _FENCE_CLOSE
+
+# One CATEGORY_WORKFLOWS entry and one command line within it
+_CATEGORY_ENTRY = "  %s: [\n%s  ],\n"
+_CATEGORY_CMD = "    '%s',\n"
+
+# PATTERNS.md is static apart from the CATEGORY_WORKFLOWS entries, which replace
+# the {{TAXONOMY}} line of the skeleton; it is split into two halves at import.
+# The skeleton is the source of truth for that text and is edited directly; it
+# is part of the .patterns_hash digest (see _GENERATOR_SOURCES below), so an
+# edit regenerates PATTERNS.md on the next run even if commands_data.json is
+# unchanged. Line endings are normalized in case a checkout converted it to CRLF.
+_PATTERNS_SKELETON_PATH = Path(__file__).parent / "patterns_skeleton.md.in"
+_PATTERNS_SKELETON = _PATTERNS_SKELETON_PATH.read_bytes().replace(b"\r\n", b"\n")
+_TAXONOMY_PLACEHOLDER = b"{{TAXONOMY}}\n"
+if _PATTERNS_SKELETON.count(_TAXONOMY_PLACEHOLDER) != 1:
+    raise RuntimeError(f"{_PATTERNS_SKELETON_PATH} must contain exactly one {{{{TAXONOMY}}}} line")
+_STATIC_PATTERNS_PRE, _STATIC_PATTERNS_POST = _PATTERNS_SKELETON.split(_TAXONOMY_PLACEHOLDER)
+
+# The outputs depend on this module's templates and the skeleton as well as on
+# commands_data.json, so both are folded into the .patterns_hash digest
+_GENERATOR_SOURCES = (Path(__file__), _PATTERNS_SKELETON_PATH)
+_GENERATOR_FINGERPRINT = hashlib.blake2b(
+    Path(__file__).read_bytes() + b"\0" + _PATTERNS_SKELETON, digest_size=16
+).digest()
+
+def _outputs_digest(raw: bytes) -> str:
+    """Digest of everything the outputs are generated from: the generator and the input bytes"""
+    h = hashlib.blake2b(_GENERATOR_FINGERPRINT, digest_size=16)
+    h.update(raw)
+    return h.hexdigest()
+
+def iter_examples_chunks(commands_data: Dict[str, Any]) -> Iterator[bytes]:
+    """Yield EXAMPLES.md as UTF-8 chunks: the static header, then one block per example"""
+    yield _EXAMPLES_STATIC_HEADER
+    sep = ""
+    for idx, (title, cmds, description) in enumerate(_MORE_EXAMPLES, start=6):
+        cmd_lines = "\n".join("/" + cmd for cmd in cmds)
+        yield (sep + _EXAMPLE_BLOCK.format(idx=idx, title=title, desc=description, cmds=cmd_lines)).encode('utf-8')
+        sep = "\n"
+
+def generate_examples_md(commands_data: Dict[str, Any]) -> bytes:
+    """Generate EXAMPLES.md with workflow chains as UTF-8 bytes"""
+    return b''.join(iter_examples_chunks(commands_data))
+
+def iter_patterns_chunks(commands_data: Dict[str, Any]) -> Iterator[bytes]:
+    """Yield PATTERNS.md as UTF-8 chunks: static prefix, taxonomy block, static suffix"""
+    # Sort once up front so any further passes over the taxonomy can reuse it
+    sorted_taxonomy = sorted(commands_data['taxonomy'].items(), key=operator.itemgetter(0))
+    taxonomy_block = "".join(
+        _CATEGORY_ENTRY % (category, "".join(_CATEGORY_CMD % cmd for cmd in heapq.nsmallest(3, cmds)))
+        for category, cmds in sorted_taxonomy
+    )
+    yield _STATIC_PATTERNS_PRE
+    yield taxonomy_block.encode('utf-8')
+    yield _STATIC_PATTERNS_POST
+
+def generate_patterns_md(commands_data: Dict[str, Any]) -> bytes:
+    """Generate PATTERNS.md with best practices as UTF-8 bytes"""
+    return b''.join(iter_patterns_chunks(commands_data))
+
+def _wait_for_file_inotify(path: Path, deadline: float) -> bool:
+    """Block on inotify events for path's directory until it is fully written (Linux)
+
+    Wakes on IN_CLOSE_WRITE or IN_MOVED_TO for path's own name, so a file that
+    has only been created and is still being written does not end the wait.
+    """
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    try:
+        in_close_write, in_moved_to = 0x8, 0x80
+        if libc.inotify_add_watch(fd, os.fsencode(path.parent), in_close_write | in_moved_to) < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+        # Re-check after the watch is armed so a write finished in between is not missed
+        if path.exists():
+            return True
+        name = os.fsencode(path.name)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            buf = os.read(fd, 4096)
+            # struct inotify_event: int wd; uint32 mask, cookie, len; char name[len]
+            offset = 0
+            while offset + 16 <= len(buf):
+                name_len = int.from_bytes(buf[offset + 12:offset + 16], sys.byteorder)
+                event_name = buf[offset + 16:offset + 16 + name_len].rstrip(b'\0')
+                if event_name == name:
+                    return True
+                offset += 16 + name_len
+    finally:
+        os.close(fd)
+
+def _wait_for_file_win32(path: Path, deadline: float) -> bool:
+    """Block on directory change notifications for path's directory (Windows)
+
+    Notifications carry no file name or close event, so this wakes on creation;
+    AGENT 1 publishes commands_data.json by rename, and amain() still retries a
+    read that is not valid JSON yet.
+    """
+    kernel32 = ctypes.windll.kernel32
+    kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+    file_notify_change_file_name = 0x1
+    wait_object_0, wait_timeout = 0x0, 0x102
+    handle = kernel32.FindFirstChangeNotificationW(str(path.parent), False, file_notify_change_file_name)
+    if handle is None or handle == ctypes.c_void_p(-1).value:
+        raise ctypes.WinError()
+    try:
+        while not path.exists():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            result = kernel32.WaitForSingleObject(ctypes.c_void_p(handle), int(remaining * 1000))
+            if result == wait_object_0:
+                kernel32.FindNextChangeNotification(ctypes.c_void_p(handle))
+            elif result != wait_timeout:
+                # WAIT_FAILED; raising makes _wait_for_file fall back to polling
+                raise ctypes.WinError()
+        return True
+    finally:
+        kernel32.FindCloseChangeNotification(ctypes.c_void_p(handle))
+
+def _wait_for_file(path: Path, timeout: float = 30) -> bool:
+    """Wait up to timeout seconds for path to exist, using OS file notifications when available"""
+    deadline = time.monotonic() + timeout
+    try:
+        if sys.platform == 'win32':
+            return _wait_for_file_win32(path, deadline)
+        if sys.platform.startswith('linux'):
+            return _wait_for_file_inotify(path, deadline)
+    except (OSError, AttributeError):
+        pass
+
+    # Fall back to polling when notifications are unavailable
+    while not path.exists():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(min(1, max(0, deadline - time.monotonic())))
+    return True
+
+def _flush_chunks(fp: BinaryIO, chunks: List[bytes]) -> None:
+    """Write a batch of chunks with one vectored syscall where the OS supports it"""
+    if HAS_WRITEV:
+        written = os.writev(fp.fileno(), chunks)
+    else:
+        written = 0
+    # writev may write short, and raw writes always can; finish with plain writes
+    if written < sum(map(len, chunks)):
+        remainder = memoryview(b''.join(chunks))[written:]
+        while remainder:
+            remainder = remainder[os.write(fp.fileno(), remainder):]
+
+def _write_chunks(fp: BinaryIO, chunks: Iterable[bytes]) -> None:
+    """Coalesce small chunks into batches of about _WRITEV_BATCH_SIZE bytes per write"""
+    pending: List[bytes] = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        # Without writev (Windows) the whole document goes out in one unbuffered
+        # WriteFile, which beats splitting it into joined batches
+        if HAS_WRITEV and (size >= _WRITEV_BATCH_SIZE or len(pending) >= _WRITEV_MAX_CHUNKS):
+            _flush_chunks(fp, pending)
+            pending, size = [], 0
+    if pending:
+        _flush_chunks(fp, pending)
+
+def _write_file(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write chunks to path using batched unbuffered writes"""
+    with path.open('wb', buffering=0) as f:
+        _write_chunks(f, chunks)
+
+def _read_json_when_complete(path: Path, timeout: float) -> Tuple[bytes, Any]:
+    """Re-read path until it parses as JSON, for a writer that has not finished yet
+
+    Returns (b'', None) if it is still incomplete after timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        raw = path.read_bytes()
+        try:
+            return raw, _loads(raw)
+        except ValueError:
+            continue
+    return b'', None
+
+async def amain(wait: bool = True) -> None:
+    log("AGENT 3: Generating patterns and examples...")
+
+    # EXAMPLES.md does not depend on commands_data, so render it while the
+    # input is being waited for and loaded
+    examples_task = asyncio.create_task(asyncio.to_thread(generate_examples_md, {}))
 
     # Load parsed commands data from AGENT 1
     data_path = Path(r"C:\Users\Ouroboros\Desktop\portflio-agent1\docs\commands_data.json")
 
     # Wait for AGENT 1 to complete if needed
+    waited = False
     if not data_path.exists():
-        print("  [WAIT] Waiting for AGENT 1 to complete...")
-        import time
-        max_wait = 30
-        waited = 0
-        while not data_path.exists() and waited < max_wait:
-            time.sleep(1)
-            waited += 1
-
-        if not data_path.exists():
+        if not wait:
+            print("  [FAIL] AGENT 1 data not available (--no-wait)")
+            return
+        log("  [WAIT] Waiting for AGENT 1 to complete...")
+        if not await asyncio.to_thread(_wait_for_file, data_path, 30):
             print("  [FAIL] AGENT 1 data not available")
             return
-
-    commands_data = json.loads(data_path.read_text(encoding='utf-8'))
-    print(f"  [OK] Loaded {len(commands_data['commands'])} commands")
+        waited = True
 
     output_dir = Path(r"C:\Users\Ouroboros\Desktop\portflio-agent3\docs")
+    examples_path = output_dir / "EXAMPLES.md"
+    patterns_path = output_dir / "PATTERNS.md"
+    hash_path = output_dir / ".patterns_hash"
+
+    # Skip regeneration when neither the input nor the generator (this module and
+    # the skeleton) changed since the last run. Sources all older than the sidecar
+    # cannot have changed, so skip hashing too.
+    outputs_exist = hash_path.exists() and examples_path.exists() and patterns_path.exists()
+    if outputs_exist:
+        newest_source = max(os.path.getmtime(p) for p in (data_path, *_GENERATOR_SOURCES))
+        if newest_source <= os.path.getmtime(hash_path):
+            print("  [SKIP] commands_data.json and generator unchanged, outputs up to date")
+            return
+
+    raw = await asyncio.to_thread(data_path.read_bytes)
+    digest = _outputs_digest(raw)
+    if outputs_exist and hash_path.read_text(encoding='utf-8') == digest:
+        print("  [SKIP] commands_data.json and generator unchanged, outputs up to date")
+        return
+
+    try:
+        commands_data = _loads(raw)
+    except ValueError:
+        # JSONDecodeError (json and orjson) subclasses ValueError. A file that only
+        # just appeared may still be mid-write, so treat it as not ready yet.
+        if not waited:
+            raise
+        log("  [WAIT] AGENT 1 data incomplete, retrying...")
+        raw, commands_data = await asyncio.to_thread(_read_json_when_complete, data_path, 30)
+        if commands_data is None:
+            print("  [FAIL] AGENT 1 data incomplete")
+            return
+        digest = _outputs_digest(raw)
+    commands_data['taxonomy'] = {
+        category: [sys.intern(cmd) for cmd in cmds]
+        for category, cmds in commands_data['taxonomy'].items()
+    }
+    log(f"  [OK] Loaded {len(commands_data['commands'])} commands")
+
     output_dir.mkdir(parents=True, exist_ok=True)
+    examples = await examples_task
 
-    # Generate EXAMPLES.md
-    print("\nGenerating EXAMPLES.md...")
-    examples = generate_examples_md(commands_data)
-    examples_path = output_dir / "EXAMPLES.md"
-    examples_path.write_text(examples, encoding='utf-8')
-    print(f"  [OK] Written to {examples_path}")
+    # Write EXAMPLES.md and generate PATTERNS.md concurrently; they are independent
+    log("\nGenerating EXAMPLES.md and PATTERNS.md...")
+    await asyncio.gather(
+        asyncio.to_thread(_write_file, examples_path, (examples,)),
+        asyncio.to_thread(_write_file, patterns_path, iter_patterns_chunks(commands_data)),
+    )
+    log(f"  [OK] Written to {examples_path}")
+    log(f"  [OK] Written to {patterns_path}")
 
-    # Generate PATTERNS.md
-    print("\nGenerating PATTERNS.md...")
-    patterns = generate_patterns_md(commands_data)
-    patterns_path = output_dir / "PATTERNS.md"
-    patterns_path.write_text(patterns, encoding='utf-8')
-    print(f"  [OK] Written to {patterns_path}")
+    hash_path.write_text(digest, encoding='utf-8')
+
+    log()
+    print("[COMPLETE] AGENT 3")
+    log(f"  - Examples: {examples_path}")
+    log(f"  - Patterns: {patterns_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="AGENT 3: Generate EXAMPLES.md and PATTERNS.md")
+    parser.add_argument('--no-wait', action='store_true',
+                        help="Fail immediately instead of waiting for AGENT 1 output")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Print progress messages (or set AGENT3_VERBOSE=1)")
+    args = parser.parse_args()
 
-    print("\n[COMPLETE] AGENT 3")
-    print(f"  - Examples: {examples_path}")
-    print(f"  - Patterns: {patterns_path}")
+    global VERBOSE
+    VERBOSE = VERBOSE or args.verbose
+    asyncio.run(amain(wait=not args.no_wait))
 
 if __name__ == '__main__':
     main()
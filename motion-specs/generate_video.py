@@ -7,7 +7,10 @@ This script orchestrates the generation of a complete portfolio showcase video
 using the Veo 3.1 API (or compatible video generation services).
 
 Requirements:
-    pip install httpx pyyaml pillow numpy
+    pip install httpx pyyaml
+
+    PyYAML should be built against libyaml (install libyaml-dev / libyaml-devel
+    before pyyaml) so the C loader is used; the pure-Python loader is the fallback.
 
 Usage:
     python generate_video.py --config kinesis_spec.yaml --output output/
@@ -20,28 +23,64 @@ import sys
 import json
 import yaml
 import time
+import random
 import asyncio
+import threading
 import argparse
 import hashlib
+import functools
+import importlib
+import importlib.util
+import itertools
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, Union, Final
 from datetime import datetime
 
-# Optional imports with graceful fallback
+# Prefer the libyaml-backed C loader; parses the specs several times faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Optional imports with graceful fallback. httpx is only probed here and
+# imported on first use, so simulated and --preview runs never pay for it.
+HAS_HTTPX = importlib.util.find_spec("httpx") is not None
+if not HAS_HTTPX:
+    print("Warning: httpx not installed. API calls will be simulated.")
+
+# h2 enables HTTP/2 in httpx
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
 try:
-    import httpx
-    HAS_HTTPX = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_HTTPX = False
-    print("Warning: httpx not installed. API calls will be simulated.")
+    HAS_ORJSON = False
 
+# Short non-cryptographic fingerprint for prompts; xxh3 when available
 try:
-    from PIL import Image
-    import numpy as np
-    HAS_IMAGING = True
+    from xxhash import xxh3_64_hexdigest as _fast_hash
 except ImportError:
-    HAS_IMAGING = False
+    def _fast_hash(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoders do not handle natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, using orjson when installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_json_default).decode('utf-8')
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes, using orjson when installed."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -69,7 +108,12 @@ class Config:
 
     # Retry configuration
     max_retries: int = 3
-    retry_delay: float = 5.0
+    retry_delay: float = 5.0  # Base delay; doubled on each retry
+    max_retry_delay: float = 60.0
+    requests_per_second: float = 2.0
+
+    # Maximum segments generated at the same time
+    max_concurrency: int = 4
 
     def __post_init__(self):
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -80,7 +124,7 @@ class Config:
 # DATA STRUCTURES
 # ═══════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Segment:
     """Represents a single video segment."""
     id: str
@@ -94,17 +138,21 @@ class Segment:
     audio_description: str
     motion_keywords: List[str]
     continuity_requirements: Dict[str, Any]
+    timeline_index: int = field(init=False, repr=False)
+    prompt_hash: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen, so derived fields are set once here via object.__setattr__.
+        # 0-based slot from IDs like "S3_profile"; parsed once so bad IDs fail at load time
+        object.__setattr__(self, "timeline_index", int(self.id.lstrip('S').split('_', 1)[0]) - 1)
+        object.__setattr__(self, "prompt_hash", _fast_hash(self.prompt.encode('utf-8'))[:8])
 
     @property
     def output_filename(self) -> str:
         return f"{self.id}_{self.name.lower().replace(' ', '_')}.mp4"
 
-    @property
-    def prompt_hash(self) -> str:
-        return hashlib.md5(self.prompt.encode()).hexdigest()[:8]
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenerationResult:
     """Result of a segment generation."""
     segment_id: str
@@ -119,6 +167,71 @@ class GenerationResult:
 # SPEC LOADER
 # ═══════════════════════════════════════════════════════════════
 
+# Parsed specs keyed by path, validated against (mtime_ns, size); LRU-bounded
+_SPEC_CACHE: "OrderedDict[str, Tuple[List[int], Any]]" = OrderedDict()
+_SPEC_CACHE_MAX = 100
+_SPEC_CACHE_LOCK = threading.Lock()
+
+
+def _load_cached(path: Path) -> Any:
+    """Load a YAML or JSON spec file, reusing earlier parses while it is unchanged.
+
+    YAML specs also get a ``<name>.cache.json`` sidecar so later processes can
+    skip the YAML parse. The sidecar is only written when the data survives a
+    JSON round-trip unchanged (YAML 1.1 turns keys like ``on`` into booleans).
+    """
+    stat = path.stat()
+    key = [stat.st_mtime_ns, stat.st_size]
+    cache_key = str(path)
+
+    with _SPEC_CACHE_LOCK:
+        hit = _SPEC_CACHE.get(cache_key)
+        if hit is not None and hit[0] == key:
+            _SPEC_CACHE.move_to_end(cache_key)
+            return hit[1]
+
+    if path.suffix == ".json":
+        data = _loads(path.read_bytes())
+    else:
+        data = _load_yaml_with_sidecar(path, key)
+
+    with _SPEC_CACHE_LOCK:
+        _SPEC_CACHE[cache_key] = (key, data)
+        _SPEC_CACHE.move_to_end(cache_key)
+        if len(_SPEC_CACHE) > _SPEC_CACHE_MAX:
+            _SPEC_CACHE.popitem(last=False)
+    return data
+
+
+def _load_if_exists(path: Path) -> Any:
+    """Load a spec file via the cache, or return None when it is missing."""
+    return _load_cached(path) if path.exists() else None
+
+
+def _load_yaml_with_sidecar(path: Path, key: List[int]) -> Any:
+    """Parse a YAML spec, going through its JSON sidecar when it is current."""
+    sidecar = path.with_suffix(path.suffix + ".cache.json")
+    try:
+        cached = _loads(sidecar.read_bytes())
+        if cached.get("key") == key:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    data = yaml.load(path.read_text(encoding='utf-8'), Loader=YAML_LOADER)
+
+    try:
+        encoded = _dumps({"key": key, "data": data})
+        if _loads(encoded)["data"] == data:
+            tmp_path = sidecar.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(encoded, encoding='utf-8')
+            os.replace(tmp_path, sidecar)
+    except (TypeError, ValueError, OSError):
+        pass  # Sidecar is an optimization only
+
+    return data
+
+
 class SpecLoader:
     """Loads and validates motion specifications."""
 
@@ -128,31 +241,39 @@ class SpecLoader:
         self.segment_manifest: Dict = {}
         self.prompt_chain: Dict = {}
 
-    def load_all(self) -> None:
-        """Load all specification files."""
+    async def load_all(self) -> None:
+        """Load all specification files concurrently."""
+        names = ("kinesis_spec.yaml", "segment_manifest.yaml", "prompt_chain.json")
+        paths = [self.spec_dir / name for name in names]
+
+        # Parse the files in parallel on the default executor
+        loop = asyncio.get_running_loop()
+        kinesis_spec, segment_manifest, prompt_chain = await asyncio.gather(*(
+            loop.run_in_executor(None, _load_if_exists, path) for path in paths
+        ))
+
+        # Drop memoized views of the previous load
+        self.__dict__.pop("segments", None)
+        self.__dict__.pop("global_context", None)
+
         # Load kinesis spec
-        kinesis_path = self.spec_dir / "kinesis_spec.yaml"
-        if kinesis_path.exists():
-            with open(kinesis_path, 'r', encoding='utf-8') as f:
-                self.kinesis_spec = yaml.safe_load(f)
+        if kinesis_spec is not None:
+            self.kinesis_spec = kinesis_spec
             print(f"[Loader] Loaded kinesis_spec.yaml")
 
         # Load segment manifest
-        manifest_path = self.spec_dir / "segment_manifest.yaml"
-        if manifest_path.exists():
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                self.segment_manifest = yaml.safe_load(f)
+        if segment_manifest is not None:
+            self.segment_manifest = segment_manifest
             print(f"[Loader] Loaded segment_manifest.yaml")
 
         # Load prompt chain
-        prompt_path = self.spec_dir / "prompt_chain.json"
-        if prompt_path.exists():
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                self.prompt_chain = json.load(f)
+        if prompt_chain is not None:
+            self.prompt_chain = prompt_chain
             print(f"[Loader] Loaded prompt_chain.json")
 
-    def get_segments(self) -> List[Segment]:
-        """Parse and return all segments."""
+    @functools.cached_property
+    def segments(self) -> List[Segment]:
+        """All segments, parsed once per load_all()."""
         segments = []
 
         for prompt_data in self.prompt_chain.get("prompts", []):
@@ -173,15 +294,101 @@ class SpecLoader:
 
         return segments
 
+    @functools.cached_property
+    def global_context(self) -> Dict[str, Any]:
+        """Global context for all generations, resolved once per load_all()."""
+        return self.prompt_chain.get("global_context", {})
+
+    def get_segments(self) -> List[Segment]:
+        """Parse and return all segments."""
+        return self.segments
+
     def get_global_context(self) -> Dict[str, Any]:
         """Get global context for all generations."""
-        return self.prompt_chain.get("global_context", {})
+        return self.global_context
 
 
 # ═══════════════════════════════════════════════════════════════
 # VIDEO GENERATOR
 # ═══════════════════════════════════════════════════════════════
 
+# Shared API clients, one per API key (each carries its key's Authorization
+# header), so connections and TLS sessions are reused across generators
+_CLIENTS: Dict[str, "httpx.AsyncClient"] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _httpx():
+    """Import httpx on first use."""
+    return importlib.import_module("httpx")
+
+
+def _get_client(api_key: str) -> "httpx.AsyncClient":
+    """Return the process-wide API client for api_key, creating it on first use."""
+    httpx = _httpx()
+    client = _CLIENTS.get(api_key)
+    if client is None or client.is_closed:
+        client = _CLIENTS[api_key] = httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            timeout=300.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30
+            ),
+            headers={"Authorization": f"Bearer {api_key}"}
+        )
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide API clients; call once before the event loop exits."""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+# Client errors worth retrying: request timeout, too early, too many requests
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429})
+
+
+class _RateLimiter:
+    """Spaces requests at least 1 / requests_per_second apart."""
+
+    def __init__(self, requests_per_second: float):
+        self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.next_allowed_at = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait for the next request slot."""
+        now = time.monotonic()
+        wait = self.next_allowed_at - now
+        # Reserve the slot before sleeping so concurrent callers queue up behind it
+        self.next_allowed_at = max(now, self.next_allowed_at) + self.min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _is_rate_limited(response: "httpx.Response") -> bool:
+    """True for 429s and error bodies that mention rate limits or quota."""
+    if response.status_code == 429:
+        return True
+    text = response.text.lower()
+    return "rate limit" in text or "quota" in text
+
+
+# Global context prepended to every segment prompt
+_CONTEXT_PREFIX_TEMPLATE = """Style: {style}
+Color Palette: {color_palette}
+Device: {device}
+Lighting: {lighting}
+Camera: {camera}
+Quality: {quality}
+
+"""
+
+
 class VideoGenerator:
     """Handles video generation via API or local simulation."""
 
@@ -189,11 +396,11 @@ class VideoGenerator:
         self.config = config
         self.client = None
 
+        self.rate_limiter = _RateLimiter(config.requests_per_second)
+        self._context_prefix: Optional[str] = None
+
         if HAS_HTTPX and config.api_key:
-            self.client = httpx.AsyncClient(
-                timeout=300.0,
-                headers={"Authorization": f"Bearer {config.api_key}"}
-            )
+            self.client = _get_client(config.api_key)
 
     async def generate_segment(self, segment: Segment, global_context: Dict) -> GenerationResult:
         """Generate a single video segment."""
@@ -236,17 +443,15 @@ class VideoGenerator:
                 generation_time=time.time() - start_time
             )
 
+    def prime(self, global_context: Dict) -> None:
+        """Render the global context prefix once for the whole run."""
+        self._context_prefix = _CONTEXT_PREFIX_TEMPLATE.format_map(defaultdict(str, global_context))
+
     def _build_enhanced_prompt(self, segment: Segment, global_context: Dict) -> str:
         """Build enhanced prompt with global context."""
-        context_prefix = f"""Style: {global_context.get('style', '')}
-Color Palette: {global_context.get('color_palette', '')}
-Device: {global_context.get('device', '')}
-Lighting: {global_context.get('lighting', '')}
-Camera: {global_context.get('camera', '')}
-Quality: {global_context.get('quality', '')}
-
-"""
-        return context_prefix + segment.prompt
+        if self._context_prefix is None:
+            self.prime(global_context)
+        return self._context_prefix + segment.prompt
 
     async def _call_api(self, segment: Segment, prompt: str) -> Dict:
         """Make actual API call to video generation service."""
@@ -263,8 +468,10 @@ Quality: {global_context.get('quality', '')}
         if self.config.seed:
             payload["seed"] = self.config.seed
 
+        httpx = _httpx()
         for attempt in range(self.config.max_retries):
             try:
+                await self.rate_limiter.acquire()
                 response = await self.client.post(
                     f"{self.config.api_endpoint}/generate",
                     json=payload
@@ -272,13 +479,30 @@ Quality: {global_context.get('quality', '')}
                 response.raise_for_status()
                 return response.json()
 
-            except httpx.HTTPStatusError as e:
-                if attempt < self.config.max_retries - 1:
-                    print(f"[Generator] Retry {attempt + 1}/{self.config.max_retries}")
-                    await asyncio.sleep(self.config.retry_delay)
-                else:
+            # TransportError covers connection failures and timeouts
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                rate_limited = False
+                if isinstance(e, httpx.HTTPStatusError):
+                    status = e.response.status_code
+                    if status < 500 and status not in RETRYABLE_STATUS_CODES:
+                        raise
+                    rate_limited = _is_rate_limited(e.response)
+
+                if attempt == self.config.max_retries - 1:
                     raise
 
+                delay = self._backoff_delay(attempt, rate_limited)
+                print(f"[Generator] Retry {attempt + 1}/{self.config.max_retries} in {delay:.1f}s ({type(e).__name__})")
+                await asyncio.sleep(delay)
+
+        raise RuntimeError(f"API call for {segment.id} made no attempts (max_retries={self.config.max_retries})")
+
+    def _backoff_delay(self, attempt: int, rate_limited: bool) -> float:
+        """Exponential backoff with jitter; throttling responses back off harder."""
+        exponent = attempt + 2 if rate_limited else attempt
+        delay = min(self.config.max_retry_delay, self.config.retry_delay * 2 ** exponent)
+        return delay * (0.5 + random.random())
+
     async def _simulate_generation(self, segment: Segment) -> Dict:
         """Simulate video generation for testing."""
         print(f"[Simulator] Simulating generation for {segment.id}")
@@ -304,17 +528,19 @@ Quality: {global_context.get('quality', '')}
             "status": "simulated"
         }
 
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_path.write_text(_dumps(metadata), encoding='utf-8')
 
         print(f"[Simulator] Created metadata: {metadata_path}")
 
         return {"status": "simulated", "path": str(metadata_path)}
 
     async def close(self):
-        """Clean up resources."""
-        if self.client:
-            await self.client.aclose()
+        """Clean up resources.
+
+        The API client is shared for the whole process and is closed by
+        close_shared_client() at shutdown, so only the reference is dropped.
+        """
+        self.client = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -327,6 +553,11 @@ class VideoConcatenator:
     def __init__(self, config: Config):
         self.config = config
 
+    async def concatenate_async(self, segment_paths: List[Path], output_path: Path) -> bool:
+        """Run concatenate() on the default executor so its file I/O does not block the loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.concatenate, segment_paths, output_path)
+
     def concatenate(self, segment_paths: List[Path], output_path: Path) -> bool:
         """Concatenate video segments with crossfade transitions."""
         print(f"\n[Concatenator] Joining {len(segment_paths)} segments")
@@ -342,41 +573,37 @@ class VideoConcatenator:
             "created_at": datetime.now().isoformat()
         }
 
-        manifest_path = output_path.with_suffix('.concat.json')
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2)
+        # Build both outputs up front, then write each in a single call
+        manifest_text = _dumps(manifest)
+        ffmpeg_cmd = self._generate_ffmpeg_command(segment_paths, output_path)
 
+        manifest_path = output_path.with_suffix('.concat.json')
+        manifest_path.write_text(manifest_text, encoding='utf-8')
         print(f"[Concatenator] Created manifest: {manifest_path}")
 
-        # Generate ffmpeg command for reference
-        ffmpeg_cmd = self._generate_ffmpeg_command(segment_paths, output_path)
+        # FFmpeg command for reference
         cmd_path = output_path.with_suffix('.ffmpeg.sh')
-        with open(cmd_path, 'w', encoding='utf-8') as f:
-            f.write(ffmpeg_cmd)
-
+        cmd_path.write_text(ffmpeg_cmd, encoding='utf-8')
         print(f"[Concatenator] FFmpeg command saved: {cmd_path}")
 
         return True
 
+    @staticmethod
+    def _xfade_clause(i: int, labels: List[str]) -> str:
+        """Crossfade of the running output into input i + 1, offset by 7.8s per segment."""
+        source = "0:v" if i == 0 else labels[i - 1]
+        offset = round(7.8 * (i + 1), 2)
+        return f"[{source}][{i + 1}:v]xfade=transition=fade:duration=0.2:offset={offset}[{labels[i]}]"
+
     def _generate_ffmpeg_command(self, segments: List[Path], output: Path) -> str:
         """Generate FFmpeg command for concatenation."""
-        inputs = " ".join([f'-i "{p}"' for p in segments])
+        inputs = " ".join(f'-i "{p}"' for p in segments)
 
-        # Build filter complex for crossfade
-        filter_parts = []
+        # Build filter complex for crossfade; output label of step i feeds step i + 1
         n = len(segments)
-
-        for i in range(n - 1):
-            if i == 0:
-                filter_parts.append(f"[0:v][1:v]xfade=transition=fade:duration=0.2:offset=7.8[v01]")
-            else:
-                prev = f"v{i-1:02d}{i:02d}" if i > 1 else "v01"
-                curr = f"v{i:02d}{i+1:02d}"
-                offset = 7.8 + (i * 7.8)
-                filter_parts.append(f"[{prev}][{i+1}:v]xfade=transition=fade:duration=0.2:offset={offset}[{curr}]")
-
-        filter_complex = ";".join(filter_parts)
-        final_label = f"v{n-2:02d}{n-1:02d}" if n > 2 else "v01"
+        labels = ["v01"] + [f"v{i:02d}{i + 1:02d}" for i in range(1, n - 1)]
+        filter_complex = ";".join(self._xfade_clause(i, labels) for i in range(n - 1))
+        final_label = labels[n - 2] if n > 2 else "v01"
 
         return f"""#!/bin/bash
 # KAIZEN Elite Portfolio - Video Concatenation
@@ -395,6 +622,14 @@ ffmpeg {inputs} \\
 # TIMELINE VISUALIZER
 # ═══════════════════════════════════════════════════════════════
 
+# Constant pieces of the timeline diagram (0-56 second ruler, 8s per segment)
+_TIMELINE_SEP = "=" * 80
+_TIMELINE_DASH = "-" * 80
+_TIMELINE_BAR = "[" + "=" * 6 + "]"
+_TIMELINE_RULER = "Time:  " + "".join(f"{i:>3}s" + " " * 5 for i in range(0, 57, 8))
+_TIMELINE_TICKS = "       " + "|" * 7
+
+
 class TimelineVisualizer:
     """Creates ASCII timeline visualization."""
 
@@ -403,75 +638,68 @@ class TimelineVisualizer:
 
     def generate(self) -> str:
         """Generate ASCII timeline diagram."""
-        lines = []
-
-        # Header
-        lines.append("=" * 80)
-        lines.append("KAIZEN ELITE PORTFOLIO - MOTION TIMELINE")
-        lines.append("=" * 80)
-        lines.append("")
-
-        # Time ruler (0-56 seconds)
-        ruler = "Time:  "
-        for i in range(0, 57, 8):
-            ruler += f"{i:>3}s" + " " * 5
-        lines.append(ruler)
-        lines.append("       " + "|" * 7)
-        lines.append("")
-
-        # Segment bars
-        total_width = 56
-        char_per_second = 1
-
-        for seg in self.segments:
-            # Calculate position
-            start_sec = int(seg.id.split('_')[0][1]) * 8 - 8 if seg.id[0] == 'S' else 0
-            # Actually parse from manifest
-
-            # Simple approach: each segment is 8 chars wide
-            seg_num = int(seg.id[1]) - 1
-            bar = " " * (seg_num * 8) + "[" + "=" * 6 + "]"
-
-            lines.append(f"S{seg_num + 1}: {bar}")
-            lines.append(f"    {seg.name}")
-            lines.append("")
-
-        # Key events
-        lines.append("-" * 80)
-        lines.append("KEY EVENTS:")
-        lines.append("-" * 80)
-
-        for seg in self.segments:
-            lines.append(f"\n{seg.id} - {seg.name}:")
-            for moment in seg.key_moments[:3]:  # Show first 3
-                lines.append(f"  {moment['time']:>8} : {moment['action']}")
+        header = (_TIMELINE_SEP, "KAIZEN ELITE PORTFOLIO - MOTION TIMELINE", _TIMELINE_SEP, "",
+                  _TIMELINE_RULER, _TIMELINE_TICKS, "")
+
+        # Segment bars: each segment is 8 chars wide
+        seg_blocks = [
+            (f"S{s.timeline_index + 1}: {' ' * (s.timeline_index * 8)}{_TIMELINE_BAR}", f"    {s.name}", "")
+            for s in self.segments
+        ]
+
+        # Key events (first 3 per segment)
+        events = [
+            (f"\n{s.id} - {s.name}:",
+             *(f"  {moment['time']:>8} : {moment['action']}" for moment in s.key_moments[:3]))
+            for s in self.segments
+        ]
 
         # Motion keywords summary
-        lines.append("")
-        lines.append("-" * 80)
-        lines.append("MOTION VOCABULARY:")
-        lines.append("-" * 80)
-
-        all_keywords = set()
-        for seg in self.segments:
-            all_keywords.update(seg.motion_keywords)
-
-        keywords_line = ", ".join(sorted(all_keywords))
-        lines.append(keywords_line)
+        all_keywords = set().union(*(s.motion_keywords for s in self.segments))
+        keywords = ("", _TIMELINE_DASH, "MOTION VOCABULARY:", _TIMELINE_DASH, ", ".join(sorted(all_keywords)))
 
-        # Footer
-        lines.append("")
-        lines.append("=" * 80)
-        lines.append(f"Total Duration: 56 seconds | Segments: {len(self.segments)} | Resolution: 1920x1080")
-        lines.append("=" * 80)
+        footer = ("", _TIMELINE_SEP,
+                  f"Total Duration: 56 seconds | Segments: {len(self.segments)} | Resolution: 1920x1080",
+                  _TIMELINE_SEP)
 
-        return "\n".join(lines)
+        return "\n".join(itertools.chain(
+            header,
+            itertools.chain.from_iterable(seg_blocks),
+            (_TIMELINE_DASH, "KEY EVENTS:", _TIMELINE_DASH),
+            itertools.chain.from_iterable(events),
+            keywords,
+            footer
+        ))
 
 
 # ═══════════════════════════════════════════════════════════════
 # MAIN ORCHESTRATOR
 # ═══════════════════════════════════════════════════════════════
 
+# The 18 specification dimensions, all fully covered by the motion specs
+_DIMENSION_NAMES: Final = (
+    "input_parsing",
+    "scene_composition",
+    "design_tokens",
+    "flow_decomposition",
+    "timeline_architecture",
+    "component_specification",
+    "motion_tracks",
+    "interaction_choreography",
+    "state_machines",
+    "transition_systems",
+    "audio_design",
+    "physics_parameters",
+    "micro_interactions",
+    "accessibility_motion",
+    "platform_adaptation",
+    "temporal_segmentation",
+    "continuity_anchoring",
+    "prompt_generation",
+)
+_COVERAGE_MATRIX: Final = tuple((f"dimension_{i}_{name}", 1.0) for i, name in enumerate(_DIMENSION_NAMES, 1))
+
+
 class GenesisOrchestrator:
     """Main orchestrator for the GENESIS pipeline."""
 
@@ -479,9 +707,16 @@ class GenesisOrchestrator:
         self.spec_dir = Path(spec_dir)
         self.config = Config(output_dir=Path(output_dir))
         self.loader = SpecLoader(spec_dir)
-        self.generator = VideoGenerator(self.config)
+        self._generator: Optional[VideoGenerator] = None
         self.concatenator = VideoConcatenator(self.config)
 
+    @property
+    def generator(self) -> VideoGenerator:
+        """Video generator, created on first use so --preview never builds one."""
+        if self._generator is None:
+            self._generator = VideoGenerator(self.config)
+        return self._generator
+
     async def run(self,
                   segment_ids: Optional[List[str]] = None,
                   preview: bool = False,
@@ -494,9 +729,9 @@ class GenesisOrchestrator:
         print("=" * 60)
 
         # Load specifications
-        self.loader.load_all()
-        segments = self.loader.get_segments()
-        global_context = self.loader.get_global_context()
+        await self.loader.load_all()
+        segments = self.loader.segments
+        global_context = self.loader.global_context
 
         print(f"\n[Orchestrator] Loaded {len(segments)} segments")
 
@@ -510,89 +745,77 @@ class GenesisOrchestrator:
         timeline = visualizer.generate()
 
         timeline_path = self.config.output_dir / "timeline_visualization.txt"
-        with open(timeline_path, 'w', encoding='utf-8') as f:
-            f.write(timeline)
+        timeline_path.write_text(timeline, encoding='utf-8')
         print(f"\n[Orchestrator] Timeline saved: {timeline_path}")
 
         if preview:
             print("\n" + timeline)
             return {"status": "preview", "segments": len(segments)}
 
-        # Generate segments
-        results = []
-        successful_paths = []
+        self.generator.prime(global_context)
+
+        # Generate segments concurrently, bounded by max_concurrency
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
 
-        for segment in segments:
-            result = await self.generator.generate_segment(segment, global_context)
-            results.append(result)
+        async def generate_one(segment: Segment) -> GenerationResult:
+            async with semaphore:
+                result = await self.generator.generate_segment(segment, global_context)
 
             if result.success and result.output_path:
-                successful_paths.append(result.output_path)
                 print(f"[Orchestrator] Generated: {result.output_path} ({result.generation_time:.2f}s)")
             else:
                 print(f"[Orchestrator] Failed: {segment.id} - {result.error_message}")
+            return result
+
+        # gather preserves segment order, which concatenation relies on
+        results = await asyncio.gather(*(generate_one(segment) for segment in segments))
+        successful_paths = [r.output_path for r in results if r.success and r.output_path]
 
         # Concatenate if requested
         if concatenate and len(successful_paths) > 1:
             final_output = self.config.output_dir / "kaizen_portfolio_final.mp4"
-            self.concatenator.concatenate(successful_paths, final_output)
+            await self.concatenator.concatenate_async(successful_paths, final_output)
 
         # Generate summary report
         report = self._generate_report(results)
         report_path = self.config.output_dir / "generation_report.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+        report_path.write_text(_dumps(report), encoding='utf-8')
 
         print(f"\n[Orchestrator] Report saved: {report_path}")
 
         # Cleanup
-        await self.generator.close()
+        if self._generator is not None:
+            await self._generator.close()
 
         return report
 
     def _generate_report(self, results: List[GenerationResult]) -> Dict[str, Any]:
         """Generate summary report."""
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
+        # Single pass: count outcomes, total the time and serialize each result
+        successful = 0
+        total_time = 0.0
+        rows = []
+        for r in results:
+            successful += r.success
+            total_time += r.generation_time
+            rows.append({
+                "segment_id": r.segment_id,
+                "success": r.success,
+                "output_path": str(r.output_path) if r.output_path else None,
+                "generation_time": r.generation_time,
+                "error": r.error_message,
+                "metadata": r.metadata
+            })
 
         return {
             "project": "KAIZEN Elite Portfolio",
             "generated_at": datetime.now().isoformat(),
             "total_segments": len(results),
-            "successful": len(successful),
-            "failed": len(failed),
-            "total_generation_time": sum(r.generation_time for r in results),
-            "results": [
-                {
-                    "segment_id": r.segment_id,
-                    "success": r.success,
-                    "output_path": str(r.output_path) if r.output_path else None,
-                    "generation_time": r.generation_time,
-                    "error": r.error_message,
-                    "metadata": r.metadata
-                }
-                for r in results
-            ],
-            "coverage_matrix": {
-                "dimension_1_input_parsing": 1.0,
-                "dimension_2_scene_composition": 1.0,
-                "dimension_3_design_tokens": 1.0,
-                "dimension_4_flow_decomposition": 1.0,
-                "dimension_5_timeline_architecture": 1.0,
-                "dimension_6_component_specification": 1.0,
-                "dimension_7_motion_tracks": 1.0,
-                "dimension_8_interaction_choreography": 1.0,
-                "dimension_9_state_machines": 1.0,
-                "dimension_10_transition_systems": 1.0,
-                "dimension_11_audio_design": 1.0,
-                "dimension_12_physics_parameters": 1.0,
-                "dimension_13_micro_interactions": 1.0,
-                "dimension_14_accessibility_motion": 1.0,
-                "dimension_15_platform_adaptation": 1.0,
-                "dimension_16_temporal_segmentation": 1.0,
-                "dimension_17_continuity_anchoring": 1.0,
-                "dimension_18_prompt_generation": 1.0
-            }
+            "successful": successful,
+            "failed": len(results) - successful,
+            "total_generation_time": total_time,
+            "results": rows,
+            "coverage_matrix": dict(_COVERAGE_MATRIX)
         }
 
 
@@ -649,13 +872,17 @@ def main():
     # Run pipeline
     orchestrator = GenesisOrchestrator(args.spec_dir, args.output)
 
-    result = asyncio.run(
-        orchestrator.run(
-            segment_ids=args.segment,
-            preview=args.preview,
-            concatenate=args.concatenate
-        )
-    )
+    async def run_and_shutdown() -> Dict[str, Any]:
+        try:
+            return await orchestrator.run(
+                segment_ids=args.segment,
+                preview=args.preview,
+                concatenate=args.concatenate
+            )
+        finally:
+            await close_shared_client()
+
+    result = asyncio.run(run_and_shutdown())
 
     # Print summary
     print("\n" + "=" * 60)
@@ -2,37 +2,112 @@
 """
 AGENT 1: Parse slash commands and generate API surface documentation
 """
+import argparse
+import hashlib
 import os
 import json
+import operator
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from collections import defaultdict
 
+# Optional faster JSON serializer; falls back to the stdlib json module
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 COMMANDS_DIR = Path(r"C:\automation_core\claude\commands")
 
+# Per-file progress is opt-in; failures and the summary always print
+VERBOSE = os.environ.get("AGENT1_VERBOSE") == "1"
+
+def log(*args: Any, **kwargs: Any) -> None:
+    """Print a progress message when verbose output is enabled"""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+# Output files are written through a buffer this large instead of the 8 KiB default
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+# Cached parses are only valid for the parser that produced them. Deriving the
+# version from this module's source (parse_command_file, its regexes and
+# _CATEGORY_KEYWORDS) discards them after any edit, with no manual bump.
+_PARSE_CACHE_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+# Patterns used by parse_command_file, compiled once at import
+_TITLE_RE = re.compile(r'^#\s+(/[\w-]+)', re.MULTILINE)
+_PURPOSE_RE = re.compile(r'Purpose:(.*?)(?=\n#|\n\n[A-Z]|$)', re.DOTALL)
+_USAGE_RE = re.compile(r'(?:What to run:|Usage:|## Usage)(.*?)(?=\n#|$)', re.DOTALL)
+_PARAM_RE = re.compile(r'--?([\w-]+)(?:\s+[<\[]?(\w+)[>\]]?)?(?:\s+-\s+(.+))?')
+_DEP_RE = re.compile(r'/[\w-]+')
+
+# Keywords that place a command in each category, in report order
+_CATEGORY_KEYWORDS = {
+    'evolution': ('evolution', 'fitness', 'generation'),
+    'testing': ('test', 'e2e', 'smoke', 'playwright'),
+    'security': ('security', 'audit', 'threat'),
+    'orchestration': ('orchestrate', 'chain', 'multi', 'swarm'),
+    'knowledge': ('rag', 'index', 'search', 'query'),
+    'operations': ('deploy', 'production', 'health', 'monitoring'),
+    'templates': ('abyssal', 'template', 'spawn'),
+    'cognition': ('think', 'reason', 'cognitive', 'consciousness'),
+}
+# Each category is one bit; a file's keyword hits reduce to an 8-bit mask
+_CATEGORY_KEYWORD_SETS = tuple(
+    (frozenset(kws), 1 << bit) for bit, kws in enumerate(_CATEGORY_KEYWORDS.values())
+)
+_ALL_CATEGORIES_MASK = (1 << len(_CATEGORY_KEYWORDS)) - 1
+# Category list for every possible mask, in report order
+_MASK_CATEGORIES = tuple(
+    tuple(category for bit, category in enumerate(_CATEGORY_KEYWORDS) if mask >> bit & 1) or ('utility',)
+    for mask in range(_ALL_CATEGORIES_MASK + 1)
+)
+# Zero-width lookahead so overlapping keywords are all found, matching substring tests
+_CATEGORY_RE = re.compile('(?=(%s))' % '|'.join(
+    re.escape(kw) for kws in _CATEGORY_KEYWORDS.values() for kw in kws
+))
+
+def _categorize(lower: str) -> int:
+    """Return the category bitmask for already-lowercased content"""
+    found = frozenset(_CATEGORY_RE.findall(lower))
+    mask = 0
+    for keywords, bit in _CATEGORY_KEYWORD_SETS:
+        if not keywords.isdisjoint(found):
+            mask |= bit
+    return mask
+
 def parse_command_file(filepath: Path) -> Dict[str, Any]:
     """Parse a single command markdown file"""
-    content = filepath.read_text(encoding='utf-8')
+    content = filepath.read_bytes().decode('utf-8')
+    if '\r' in content:
+        # Same universal-newline translation read_text would apply
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
 
     # Extract command name from filename
     cmd_name = filepath.stem
 
     # Extract title (first # heading)
-    title_match = re.search(r'^#\s+(/[\w-]+)', content, re.MULTILINE)
+    title_match = _TITLE_RE.search(content)
     title = title_match.group(1) if title_match else f"/{cmd_name}"
 
     # Extract purpose section
-    purpose_match = re.search(r'Purpose:(.*?)(?=\n#|\n\n[A-Z]|$)', content, re.DOTALL)
+    purpose_match = _PURPOSE_RE.search(content)
     purpose = purpose_match.group(1).strip() if purpose_match else ""
+    purpose_first_line = purpose.split('\n', 1)[0].strip('- ').strip() if purpose else ""
 
     # Extract what to run / usage section
-    usage_match = re.search(r'(?:What to run:|Usage:|## Usage)(.*?)(?=\n#|$)', content, re.DOTALL)
+    usage_match = _USAGE_RE.search(content)
     usage = usage_match.group(1).strip() if usage_match else ""
 
     # Extract parameters from code blocks or bullet points
+    # Every match starts with '-', so the regex starts at the first dash (or is skipped)
     params = []
-    param_matches = re.findall(r'--?([\w-]+)(?:\s+[<\[]?(\w+)[>\]]?)?(?:\s+-\s+(.+))?', content)
+    first_dash = content.find('-')
+    param_matches = _PARAM_RE.findall(content, first_dash) if first_dash >= 0 else ()
     for param_name, param_type, param_desc in param_matches:
         if param_name and not param_name.startswith('python'):
             params.append({
@@ -41,39 +116,19 @@ def parse_command_file(filepath: Path) -> Dict[str, Any]:
                 'description': param_desc.strip() if param_desc else ''
             })
 
-    # Detect dependencies (mentions of other commands)
-    dependencies = []
-    dep_matches = re.findall(r'/[\w-]+', content)
-    for dep in dep_matches:
-        if dep != title and dep not in dependencies:
-            dependencies.append(dep)
-
-    # Categorize by keywords
-    categories = []
-    if any(kw in content.lower() for kw in ['evolution', 'fitness', 'generation']):
-        categories.append('evolution')
-    if any(kw in content.lower() for kw in ['test', 'e2e', 'smoke', 'playwright']):
-        categories.append('testing')
-    if any(kw in content.lower() for kw in ['security', 'audit', 'threat']):
-        categories.append('security')
-    if any(kw in content.lower() for kw in ['orchestrate', 'chain', 'multi', 'swarm']):
-        categories.append('orchestration')
-    if any(kw in content.lower() for kw in ['rag', 'index', 'search', 'query']):
-        categories.append('knowledge')
-    if any(kw in content.lower() for kw in ['deploy', 'production', 'health', 'monitoring']):
-        categories.append('operations')
-    if any(kw in content.lower() for kw in ['abyssal', 'template', 'spawn']):
-        categories.append('templates')
-    if any(kw in content.lower() for kw in ['think', 'reason', 'cognitive', 'consciousness']):
-        categories.append('cognition')
-
-    if not categories:
-        categories.append('utility')
+    # Detect dependencies (mentions of other commands), first mention order
+    dependencies = list(dict.fromkeys(_DEP_RE.findall(content)))
+    if title in dependencies:
+        dependencies.remove(title)
+
+    # Categorize by keywords in a single scan of the lowercased content
+    categories = list(_MASK_CATEGORIES[_categorize(content.lower())])
 
     return {
         'name': title,
         'filename': cmd_name,
         'purpose': purpose,
+        'purpose_first_line': purpose_first_line,
         'usage': usage,
         'parameters': params,
         'dependencies': dependencies,
@@ -81,108 +136,221 @@ def parse_command_file(filepath: Path) -> Dict[str, Any]:
         'file_path': str(filepath)
     }
 
+def _parse_command_file_safe(filepath: Path) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parse a command file in a worker, returning (data, None) or (None, error)"""
+    try:
+        return parse_command_file(filepath), None
+    except Exception as e:
+        return None, str(e)
+
+def scan_command_files(directory: Path) -> List[Tuple[Path, List[int]]]:
+    """List *.md command files with their [mtime_ns, size] in one scandir pass"""
+    files = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith('.md') and entry.is_file():
+                st = entry.stat()
+                files.append((Path(entry.path), [st.st_mtime_ns, st.st_size]))
+    return sorted(files)
+
+def load_parse_cache(cache_path: Path) -> Dict[str, Tuple[List[int], Dict[str, Any]]]:
+    """Map file_path -> ([mtime_ns, size], command) from a previous run's cache sidecar"""
+    try:
+        raw = cache_path.read_bytes()
+        cache = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict) or cache.get('version') != _PARSE_CACHE_VERSION:
+        return {}
+
+    stats = cache.get('files', {})
+    return {
+        file_path: (stats[file_path], cmd)
+        for file_path, cmd in cache.get('commands', {}).items()
+        if file_path in stats
+    }
+
+def save_parse_cache(cache_path: Path, file_stats: Dict[str, List[int]], commands: List[Dict]) -> None:
+    """Record each parsed file's [mtime_ns, size] and command for the next run"""
+    cache = {
+        'version': _PARSE_CACHE_VERSION,
+        'files': file_stats,
+        'commands': {cmd['file_path']: cmd for cmd in commands}
+    }
+    cache_path.write_bytes(orjson.dumps(cache) if HAS_ORJSON else json.dumps(cache).encode('utf-8'))
+
+# Column accessors for walking the command records field by field
+_NAME = operator.itemgetter('name')
+_CATEGORIES = operator.itemgetter('categories')
+_DEPENDENCIES = operator.itemgetter('dependencies')
+
 def build_dependency_graph(commands: List[Dict]) -> Dict[str, List[str]]:
-    """Build command dependency graph"""
-    graph = defaultdict(list)
-    cmd_names = {cmd['name'] for cmd in commands}
+    """Build command dependency graph, with each command's dependencies sorted"""
+    graph = defaultdict(set)
+    names = list(map(_NAME, commands))
+    cmd_names = set(names)
 
-    for cmd in commands:
-        for dep in cmd['dependencies']:
-            if dep in cmd_names:
-                graph[cmd['name']].append(dep)
+    for name, deps in zip(names, map(_DEPENDENCIES, commands)):
+        graph[name].update(cmd_names.intersection(deps))
 
-    return dict(graph)
+    return {name: sorted(deps) for name, deps in graph.items() if deps}
 
 def build_taxonomy(commands: List[Dict]) -> Dict[str, List[str]]:
-    """Build command taxonomy by category"""
+    """Build command taxonomy by category, with categories and names pre-sorted"""
     taxonomy = defaultdict(list)
 
-    for cmd in commands:
-        for category in cmd['categories']:
-            taxonomy[category].append(cmd['name'])
+    for name, categories in zip(map(_NAME, commands), map(_CATEGORIES, commands)):
+        for category in categories:
+            taxonomy[category].append(name)
+
+    return {category: sorted(names) for category, names in sorted(taxonomy.items())}
+
+def _render_command_reference(cmd: Dict, dep_graph: Dict) -> str:
+    """Render one command's Command Reference section as a single block"""
+    purpose = f"**Purpose:**\n{cmd['purpose']}\n\n" if cmd['purpose'] else ""
+
+    params = ""
+    if cmd['parameters']:
+        params = "**Parameters:**\n%s\n" % ''.join(
+            f"- `--{param['name']}` ({param['type']})"
+            + (f" - {param['description']}" if param['description'] else "")
+            + "\n"
+            for param in cmd['parameters']
+        )
 
-    return dict(taxonomy)
+    dep_names = dep_graph.get(cmd['name'])
+    deps = f"**Dependencies:** {', '.join(f'`{d}`' for d in dep_names)}\n\n" if dep_names else ""
+
+    usage = f"**Usage:**\n```bash\n{cmd['usage']}\n```\n\n" if cmd['usage'] else ""
+
+    return (
+        f"\n### {cmd['name']}\n"
+        f"**Category:** {', '.join(cmd['categories'])}\n\n"
+        f"{purpose}{params}{deps}{usage}"
+    )
 
 def generate_api_surface_md(commands: List[Dict], taxonomy: Dict, dep_graph: Dict) -> str:
-    """Generate API_SURFACE.md"""
-    md = []
-    md.append("# Claude Automation Core - API Surface\n")
-    md.append("Complete command reference for all 80+ slash commands\n")
-    md.append(f"**Total Commands:** {len(commands)}\n")
-
-    md.append("\n## Command Taxonomy\n")
-    for category, cmds in sorted(taxonomy.items()):
-        md.append(f"\n### {category.title()} ({len(cmds)} commands)\n")
-        for cmd in sorted(cmds):
-            md.append(f"- `{cmd}`\n")
-
-    md.append("\n## Command Reference\n")
-    for cmd in sorted(commands, key=lambda x: x['name']):
-        md.append(f"\n### {cmd['name']}\n")
-        md.append(f"**Category:** {', '.join(cmd['categories'])}\n\n")
-
-        if cmd['purpose']:
-            md.append(f"**Purpose:**\n{cmd['purpose']}\n\n")
-
-        if cmd['parameters']:
-            md.append("**Parameters:**\n")
-            for param in cmd['parameters']:
-                desc = f" - {param['description']}" if param['description'] else ""
-                md.append(f"- `--{param['name']}` ({param['type']}){desc}\n")
-            md.append("\n")
-
-        if cmd['name'] in dep_graph and dep_graph[cmd['name']]:
-            md.append(f"**Dependencies:** {', '.join(f'`{d}`' for d in dep_graph[cmd['name']])}\n\n")
-
-        if cmd['usage']:
-            md.append(f"**Usage:**\n```bash\n{cmd['usage']}\n```\n\n")
-
-    md.append("\n## Dependency Graph\n")
-    md.append("```\n")
-    for cmd, deps in sorted(dep_graph.items()):
+    """Generate API_SURFACE.md from name-sorted commands and a build_taxonomy() result"""
+    parts = [
+        "# Claude Automation Core - API Surface\n"
+        "Complete command reference for all 80+ slash commands\n"
+        f"**Total Commands:** {len(commands)}\n"
+        "\n## Command Taxonomy\n"
+    ]
+
+    for category, cmds in taxonomy.items():
+        parts.append(
+            f"\n### {category.title()} ({len(cmds)} commands)\n"
+            + ''.join(f"- `{cmd}`\n" for cmd in cmds)
+        )
+
+    parts.append("\n## Command Reference\n")
+    parts.extend(_render_command_reference(cmd, dep_graph) for cmd in commands)
+
+    # The commands are already in name order; reuse it rather than sorting the graph
+    graph_blocks = []
+    for name in dict.fromkeys(map(_NAME, commands)):
+        deps = dep_graph.get(name)
         if deps:
-            md.append(f"{cmd}\n")
-            for dep in deps:
-                md.append(f"  -> {dep}\n")
-    md.append("```\n")
+            graph_blocks.append(f"{name}\n" + ''.join(f"  -> {dep}\n" for dep in deps))
+    parts.append("\n## Dependency Graph\n```\n" + ''.join(graph_blocks) + "```\n")
 
-    return ''.join(md)
+    return ''.join(parts)
 
 def update_elite_skills_registry(commands: List[Dict], taxonomy: Dict) -> str:
-    """Generate updated ELITE_SKILLS_REGISTRY.md section"""
-    md = []
-    md.append("# Elite Skills Registry - Command Catalog\n")
-    md.append(f"**Last Updated:** Auto-generated by AGENT 1\n")
-    md.append(f"**Total Commands:** {len(commands)}\n")
-
-    md.append("\n## Quick Reference by Category\n")
-    for category, cmds in sorted(taxonomy.items()):
-        md.append(f"\n### {category.title()}\n")
-        for cmd in sorted(cmds):
-            cmd_data = next((c for c in commands if c['name'] == cmd), None)
+    """Generate updated ELITE_SKILLS_REGISTRY.md section from a build_taxonomy() result"""
+    # Built in reverse so the first command with a given name wins, as before
+    by_name = {c['name']: c for c in reversed(commands)}
+
+    parts = [
+        "# Elite Skills Registry - Command Catalog\n"
+        "**Last Updated:** Auto-generated by AGENT 1\n"
+        f"**Total Commands:** {len(commands)}\n"
+        "\n## Quick Reference by Category\n"
+    ]
+
+    for category, cmds in taxonomy.items():
+        lines = [f"\n### {category.title()}\n"]
+        for cmd in cmds:
+            cmd_data = by_name.get(cmd)
             if cmd_data and cmd_data['purpose']:
-                # Get first line of purpose
-                first_line = cmd_data['purpose'].split('\n')[0].strip('- ').strip()
-                md.append(f"- `{cmd}` - {first_line}\n")
+                lines.append(f"- `{cmd}` - {cmd_data['purpose_first_line']}\n")
             else:
-                md.append(f"- `{cmd}`\n")
-
-    return ''.join(md)
+                lines.append(f"- `{cmd}`\n")
+        parts.append(''.join(lines))
+
+    return ''.join(parts)
+
+def _write_text(path: Path, text: str) -> None:
+    """Write text as UTF-8 through a large buffer"""
+    with open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(text)
+
+def _iter_orjson_chunks(data: Dict[str, Any]) -> Iterator[bytes]:
+    """Serialize a dict like orjson OPT_INDENT_2, one top-level value or list item at a time
+
+    Strings never contain raw newlines in orjson output, so nested values are
+    re-indented by prefixing every line break.
+    """
+    yield b'{'
+    for i, (key, value) in enumerate(data.items()):
+        yield b',\n  ' if i else b'\n  '
+        yield orjson.dumps(key) + b': '
+        if isinstance(value, list) and value:
+            yield b'['
+            for j, item in enumerate(value):
+                yield b',\n    ' if j else b'\n    '
+                yield orjson.dumps(item, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n    ')
+            yield b'\n  ]'
+        else:
+            yield orjson.dumps(value, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  ')
+    yield b'\n}' if data else b'}'
 
 def main():
+    parser = argparse.ArgumentParser(description="AGENT 1: Parse slash commands into API surface docs")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Print a line per parsed file (or set AGENT1_VERBOSE=1)")
+    args = parser.parse_args()
+
+    global VERBOSE
+    VERBOSE = VERBOSE or args.verbose
+
     print("AGENT 1: Parsing slash commands...")
 
-    # Parse all command files
+    data_path = Path(r"C:\Users\Ouroboros\Desktop\portflio-agent1\docs\commands_data.json")
+    # Machine-specific reuse data stays out of the published commands_data.json
+    cache_path = data_path.with_name("commands_data.cache.json")
+
+    # Only files whose mtime or size changed since the last run are re-parsed
+    cache = load_parse_cache(cache_path)
+    files = scan_command_files(COMMANDS_DIR)
+    stale = [filepath for filepath, stat in files
+             if cache.get(str(filepath), (None, None))[0] != stat]
+
+    # Parse changed command files across worker processes
+    parsed = {}
+    if stale:
+        with ProcessPoolExecutor() as ex:
+            parsed = dict(zip(stale, ex.map(_parse_command_file_safe, stale, chunksize=8)))
+
     commands = []
-    for filepath in sorted(COMMANDS_DIR.glob("*.md")):
-        try:
-            cmd_data = parse_command_file(filepath)
-            commands.append(cmd_data)
-            print(f"  [OK] Parsed {cmd_data['name']}")
-        except Exception as e:
-            print(f"  [FAIL] Failed to parse {filepath.name}: {e}")
+    file_stats = {}
+    for filepath, stat in files:
+        if filepath in parsed:
+            cmd_data, error = parsed[filepath]
+            if error is not None:
+                print(f"  [FAIL] Failed to parse {filepath.name}: {error}")
+                continue
+            log(f"  [OK] Parsed {cmd_data['name']}")
+        else:
+            cmd_data = cache[str(filepath)][1]
+        commands.append(cmd_data)
+        file_stats[str(filepath)] = stat
 
     print(f"\nTotal commands parsed: {len(commands)}")
+    if len(files) > len(stale):
+        print(f"  [OK] Reused {len(files) - len(stale)} unchanged from the previous run")
 
     # Build dependency graph
     print("\nBuilding dependency graph...")
@@ -193,28 +361,28 @@ def main():
     print("\nBuilding command taxonomy...")
     taxonomy = build_taxonomy(commands)
     print(f"  [OK] Categorized into {len(taxonomy)} categories")
-    for category, cmds in sorted(taxonomy.items()):
+    for category, cmds in taxonomy.items():
         print(f"    - {category}: {len(cmds)} commands")
 
     # Generate API_SURFACE.md
     print("\nGenerating API_SURFACE.md...")
-    api_surface = generate_api_surface_md(commands, taxonomy, dep_graph)
+    commands_sorted = sorted(commands, key=_NAME)
+    api_surface = generate_api_surface_md(commands_sorted, taxonomy, dep_graph)
     output_path = Path(r"C:\Users\Ouroboros\Desktop\portflio-agent1\docs\API_SURFACE.md")
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(api_surface, encoding='utf-8')
+    _write_text(output_path, api_surface)
     print(f"  [OK] Written to {output_path}")
 
     # Update ELITE_SKILLS_REGISTRY.md
     print("\nGenerating ELITE_SKILLS_REGISTRY.md...")
-    registry = update_elite_skills_registry(commands, taxonomy)
+    registry = update_elite_skills_registry(commands_sorted, taxonomy)
     registry_path = Path(r"C:\Users\Ouroboros\Desktop\portflio-agent1\docs\ELITE_SKILLS_REGISTRY.md")
-    registry_path.write_text(registry, encoding='utf-8')
+    _write_text(registry_path, registry)
     print(f"  [OK] Written to {registry_path}")
 
     # Export structured data
     print("\nExporting structured data...")
-    data_path = Path(r"C:\Users\Ouroboros\Desktop\portflio-agent1\docs\commands_data.json")
-    data_path.write_text(json.dumps({
+    data = {
         'commands': commands,
         'taxonomy': taxonomy,
         'dependency_graph': dep_graph,
@@ -224,8 +392,23 @@ def main():
             'commands_with_dependencies': len(dep_graph),
             'commands_with_parameters': sum(1 for c in commands if c['parameters'])
         }
-    }, indent=2), encoding='utf-8')
+    }
+    # Written beside the target and renamed into place, so readers such as
+    # AGENT 3 (which watches for the rename) never see a partial file
+    tmp_path = data_path.with_name(data_path.name + ".tmp")
+    try:
+        if HAS_ORJSON:
+            with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(_iter_orjson_chunks(data))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=2)
+        os.replace(tmp_path, data_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     print(f"  [OK] Written to {data_path}")
+    save_parse_cache(cache_path, file_stats, commands)
 
     print("\n[COMPLETE] AGENT 1")
     print(f"  - {len(commands)} commands parsed")